@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Atomic file writes shared by the caches and the scorer's output files
+"""
+
+import os
+import tempfile
+
+def write_atomic(path, write, mode='w'):
+    """
+    Write a file through a temp file in the same directory, then rename it
+
+    Readers never see a half-written file, and a failed write leaves the
+    old one in place. The temp name is unique per call (mkstemp), so two
+    threads writing the same path can't replace or delete each other's
+    temp file.
+
+    Args:
+        path: Destination file
+        write: Callable given the open temp file object
+        mode: 'w' for text (UTF-8) or 'wb' for binary
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory or ".")
+
+    try:
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
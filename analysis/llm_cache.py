@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of Claude scoring responses, keyed by prompt hash
+"""
+
+import os
+import json
+import time
+import hashlib
+
+from atomic_write import write_atomic
+
+def _default_ttl_days():
+    """Read cache TTL from LLM_CACHE_TTL_DAYS (unset = never expire)"""
+    ttl = os.getenv("LLM_CACHE_TTL_DAYS")
+    return float(ttl) if ttl else None
+
+class LLMCache:
+    """
+    Stores parsed scores as {sha256(prompt)}.json files
+
+    The rubric is deterministic, so entries never expire unless a TTL is
+    configured through the LLM_CACHE_TTL_DAYS environment variable.
+    """
+
+    def __init__(self, cache_dir="data/llm_cache", ttl_days=None):
+        self.cache_dir = cache_dir
+        self.ttl_days = ttl_days if ttl_days is not None else _default_ttl_days()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, prompt):
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, prompt):
+        """Return cached scores for a prompt, or None on miss/expiry"""
+        path = self._path(prompt)
+
+        try:
+            if self.ttl_days is not None:
+                age_days = (time.time() - os.path.getmtime(path)) / 86400
+                if age_days > self.ttl_days:
+                    return None
+
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def set(self, prompt, scores):
+        """Store scores for a prompt (usage stats are not cached)"""
+        scores = {k: v for k, v in scores.items() if k != 'tokens_used'}
+        path = self._path(prompt)
+
+        # Duplicate papers can reach two workers at once, so each write gets
+        # its own temp file; an interrupted run can't leave a truncated entry
+        write_atomic(path, lambda f: json.dump(scores, f))
@@ -4,54 +4,246 @@ Score papers using Claude API
 """
 
 import os
+import re
+import math
 import json
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 from anthropic import Anthropic
 from dotenv import load_dotenv
 from tqdm import tqdm
 import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from anthropic import RateLimitError, APIStatusError, APIConnectionError, NotFoundError
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 
 from scoring_rubric import get_scoring_prompt
+from llm_cache import LLMCache
+from atomic_write import write_atomic
+from rate_limiter import TokenBucket
+
+# Semantic near-duplicate matching needs sentence-transformers
+try:
+    from semantic_cache import SemanticCache
+except ImportError:
+    SemanticCache = None
 
 # Load environment
 load_dotenv()
 
-def score_paper(paper, client):
+MODEL = "claude-sonnet-4-20250514"
+
+# Seconds between status checks while a message batch is processing
+BATCH_POLL_INTERVAL = 30
+
+# The JSON scores fit in ~350 output tokens; a tighter cap saves OTPM quota
+MAX_TOKENS = int(os.getenv("CLAUDE_MAX_TOKENS", 450))
+
+# Cap for the one retry given to a reply cut off at MAX_TOKENS
+RETRY_MAX_TOKENS = 2 * MAX_TOKENS
+
+# Account tier limits for direct requests (defaults: Tier 1 Sonnet)
+TIER_RPM = int(os.getenv("TIER_RPM", 50))
+TIER_ITPM = int(os.getenv("TIER_ITPM", 30000))
+TIER_OTPM = int(os.getenv("TIER_OTPM", 8000))
+
+# Rough wall time of one scoring request, used to size the worker pool
+AVG_REQUEST_SECONDS = 10
+
+def _default_workers():
+    """Workers needed to keep the binding limit (RPM or OTPM) saturated"""
+    requests_per_second = min(TIER_RPM, TIER_OTPM / MAX_TOKENS) / 60
+    return max(1, math.ceil(requests_per_second * AVG_REQUEST_SECONDS))
+
+MAX_WORKERS = int(os.getenv("SCORER_WORKERS", 0)) or _default_workers()
+
+# JSON object inside an optional ```json markdown fence
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+
+# Attempts per request before a paper is given up on
+MAX_ATTEMPTS = 6
+
+# Run statistics shared by worker threads
+_retry_count = 0
+_output_tokens = []
+_truncated_count = 0
+_stats_lock = threading.Lock()
+
+def _parse_scores(response_text):
+    """
+    Parse the JSON scores out of a Claude response
+    
+    Args:
+        response_text: Raw text of the model reply
+    
+    Returns:
+        Dictionary with scores (raises json.JSONDecodeError if malformed)
+    """
+    
+    # Remove markdown code blocks if present
+    m = _JSON_FENCE.search(response_text)
+    payload = m.group(1) if m else response_text.strip()
+    
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        # json is more lenient (e.g. NaN literals)
+        return json.loads(payload)
+
+def _record_output(message):
+    """Track output token usage to check MAX_TOKENS isn't truncating replies"""
+    global _truncated_count
+    
+    with _stats_lock:
+        _output_tokens.append(message.usage.output_tokens)
+        if message.stop_reason == "max_tokens":
+            _truncated_count += 1
+
+def _tokens_used(usage):
+    """Total tokens billed for a message, including prompt cache reads/writes"""
+    return (
+        usage.input_tokens
+        + usage.output_tokens
+        + (getattr(usage, 'cache_read_input_tokens', 0) or 0)
+        + (getattr(usage, 'cache_creation_input_tokens', 0) or 0)
+    )
+
+def _cache_prompt(system_blocks, user_text):
+    """Full prompt text used as the response cache key"""
+    system_text = "".join(block["text"] for block in system_blocks)
+    return f"{MODEL}\n{system_text}\n{user_text}"
+
+def _estimate_tokens(system_blocks, user_text):
+    """Rough input token count (~4 characters per token)"""
+    chars = sum(len(block["text"]) for block in system_blocks) + len(user_text)
+    return chars // 4
+
+def _backoff_delay(error, attempt):
+    """Seconds to wait before retrying: retry-after if sent, else exponential"""
+    try:
+        return float(error.response.headers["retry-after"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return min(60, 2 ** attempt) + random.uniform(0, 1)
+
+def _is_retryable(error):
+    """Rate limits, overloads, server errors and dropped connections"""
+    if isinstance(error, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+def _create_message(client, system_blocks, user_text, bucket=None, max_tokens=MAX_TOKENS):
+    """
+    Call messages.create, retrying transient failures with backoff
+    
+    Raises the last error once MAX_ATTEMPTS is exhausted.
+    """
+    global _retry_count
+    
+    for attempt in range(MAX_ATTEMPTS):
+        if bucket is not None:
+            bucket.acquire(_estimate_tokens(system_blocks, user_text))
+        
+        try:
+            # Retries are handled here, so disable the SDK's own
+            return client.with_options(max_retries=0).messages.create(
+                model=MODEL,
+                max_tokens=max_tokens,
+                system=system_blocks,
+                messages=[
+                    {"role": "user", "content": user_text}
+                ]
+            )
+        except (APIStatusError, APIConnectionError) as e:
+            if not _is_retryable(e) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            
+            delay = _backoff_delay(e, attempt)
+            
+            # Hold back the other workers too rather than letting them
+            # keep hitting the limit
+            if bucket is not None and isinstance(e, RateLimitError):
+                bucket.pause(delay)
+            
+            with _stats_lock:
+                _retry_count += 1
+            
+            time.sleep(delay)
+
+def _with_retries(call):
+    """Run an API call, retrying transient failures with backoff"""
+    global _retry_count
+    
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return call()
+        except (APIStatusError, APIConnectionError) as e:
+            if not _is_retryable(e) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            
+            with _stats_lock:
+                _retry_count += 1
+            
+            time.sleep(_backoff_delay(e, attempt))
+
+def score_paper(paper, client, cache=None, semantic_cache=None, bucket=None):
     """
     Score a single paper using Claude API
     
     Args:
         paper: Dictionary with paper metadata
         client: Anthropic client
+        cache: Optional LLMCache to read/write responses
+        semantic_cache: Optional SemanticCache for near-duplicate papers
+        bucket: Optional TokenBucket to wait on before calling the API
     
     Returns:
         Dictionary with scores
     """
     
-    prompt = get_scoring_prompt(paper)
+    system_blocks, user_text = get_scoring_prompt(paper)
+    prompt = _cache_prompt(system_blocks, user_text)
+    
+    if cache is not None:
+        cached = cache.get(prompt)
+        if cached is not None:
+            return cached
+    
+    if semantic_cache is not None:
+        cached = semantic_cache.lookup(paper)
+        if cached is not None:
+            return cached
     
     try:
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1000,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
+        message = _create_message(client, system_blocks, user_text, bucket)
+        _record_output(message)
         
         response_text = message.content[0].text
         
-        # Parse JSON response
-        # Remove markdown code blocks if present
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0]
+        # A reply cut off at MAX_TOKENS is usually incomplete JSON; ask
+        # once more with room to finish
+        try:
+            scores = _parse_scores(response_text)
+        except json.JSONDecodeError:
+            if message.stop_reason != "max_tokens":
+                raise
+            message = _create_message(client, system_blocks, user_text, bucket, RETRY_MAX_TOKENS)
+            _record_output(message)
+            response_text = message.content[0].text
+            scores = _parse_scores(response_text)
         
-        scores = json.loads(response_text.strip())
+        if cache is not None:
+            cache.set(prompt, scores)
+        if semantic_cache is not None:
+            semantic_cache.add(paper, scores)
         
         # Add usage stats
-        scores['tokens_used'] = message.usage.input_tokens + message.usage.output_tokens
+        scores['tokens_used'] = _tokens_used(message.usage)
         
         return scores
         
@@ -64,7 +256,250 @@ def score_paper(paper, client):
         print(f"\n❌ Error scoring paper: {e}")
         return None
 
-def score_papers_batch(input_csv, output_csv, max_papers=None):
+def score_papers_message_batch(papers, client, cache=None, semantic_cache=None, batch_id_path=None):
+    """
+    Score papers with a single Message Batches API job
+    
+    All prompts are submitted at once and processed asynchronously by
+    Anthropic, so wall time no longer scales with the number of papers.
+    
+    The batch id is saved to batch_id_path once submitted, so a run
+    interrupted while polling picks the same batch back up rather than
+    paying for a second one. Polling and result downloads retry transient
+    errors; if they still fail, the batch is cancelled before the error is
+    raised so the caller's direct fallback isn't billed twice.
+    
+    Args:
+        papers: Dictionary mapping custom_id -> paper metadata
+        client: Anthropic client
+        cache: Optional LLMCache to store responses in
+        semantic_cache: Optional SemanticCache to store responses in
+        batch_id_path: Optional file to save/resume the batch id from
+    
+    Returns:
+        Tuple of (scores by custom_id, custom_ids that failed in the batch)
+    """
+    
+    requests = []
+    prompts = {}
+    
+    for custom_id, paper in papers.items():
+        system_blocks, user_text = get_scoring_prompt(paper)
+        prompts[custom_id] = _cache_prompt(system_blocks, user_text)
+        requests.append(Request(
+            custom_id=custom_id,
+            params=MessageCreateParamsNonStreaming(
+                model=MODEL,
+                max_tokens=MAX_TOKENS,
+                system=system_blocks,
+                messages=[
+                    {"role": "user", "content": user_text}
+                ]
+            )
+        ))
+    
+    batch = None
+    
+    # Resume a batch submitted by an interrupted run
+    if batch_id_path and os.path.exists(batch_id_path):
+        with open(batch_id_path, encoding='utf-8') as f:
+            batch_id = f.read().strip()
+        
+        try:
+            batch = _with_retries(lambda: client.messages.batches.retrieve(batch_id))
+            print(f"Resuming batch {batch.id} ({batch.processing_status})")
+        except NotFoundError:
+            print(f"⚠️  Saved batch {batch_id} no longer exists, submitting a new one")
+    
+    if batch is None:
+        batch = client.messages.batches.create(requests=requests)
+        print(f"Submitted batch {batch.id} ({len(requests)} requests)")
+        
+        if batch_id_path:
+            with open(batch_id_path, 'w', encoding='utf-8') as f:
+                f.write(batch.id)
+    
+    try:
+        # Wait for the batch to finish processing
+        while batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = _with_retries(lambda: client.messages.batches.retrieve(batch.id))
+            counts = batch.request_counts
+            print(f"  {batch.processing_status}: {counts.succeeded} succeeded, "
+                  f"{counts.errored} errored, {counts.processing} processing")
+        
+        entries = _with_retries(lambda: list(client.messages.batches.results(batch.id)))
+    except Exception:
+        # Ctrl-C (not an Exception) skips this and keeps the batch to resume
+        try:
+            client.messages.batches.cancel(batch.id)
+        except Exception as e:
+            print(f"⚠️  Could not cancel batch {batch.id}: {e}")
+        if batch_id_path and os.path.exists(batch_id_path):
+            os.remove(batch_id_path)
+        raise
+    
+    results = {}
+    failed = []
+    
+    for entry in entries:
+        # A resumed batch may include papers scored since it was submitted
+        if entry.custom_id not in papers:
+            continue
+        
+        paper = papers[entry.custom_id]
+        
+        if entry.result.type != "succeeded":
+            print(f"\n❌ Batch request {entry.result.type} for: {paper.get('title', 'Unknown')[:50]}...")
+            failed.append(entry.custom_id)
+            continue
+        
+        message = entry.result.message
+        _record_output(message)
+        response_text = message.content[0].text
+        
+        try:
+            scores = _parse_scores(response_text)
+        except json.JSONDecodeError:
+            print(f"\n⚠️  JSON parsing error for: {paper.get('title', 'Unknown')[:50]}...")
+            print(f"   Response: {response_text[:200]}")
+            # Truncated replies are re-scored directly with a larger cap
+            if message.stop_reason == "max_tokens":
+                failed.append(entry.custom_id)
+            continue
+        
+        if cache is not None:
+            cache.set(prompts[entry.custom_id], scores)
+        if semantic_cache is not None:
+            semantic_cache.add(paper, scores)
+        
+        # Add usage stats
+        scores['tokens_used'] = _tokens_used(message.usage)
+        results[entry.custom_id] = scores
+    
+    # Papers missing from a resumed batch still need scoring
+    returned = {entry.custom_id for entry in entries}
+    failed.extend(custom_id for custom_id in papers if custom_id not in returned)
+    
+    return results, failed
+
+def _json_default(obj):
+    """orjson fallback for values it can't serialize (pd.NA, Arrow scalars)"""
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    return str(obj)
+
+def _journal_scored_paper(journal, paper, scores):
+    """Append paper data combined with its scores as one JSON line"""
+    scored_paper = {**paper, **scores}
+    journal.write(orjson.dumps(scored_paper, default=_json_default) + b"\n")
+    journal.flush()
+
+def _journaled_titles(journal_path):
+    """
+    Titles already written to a scoring journal by an interrupted run
+    
+    A line left half-written by a crash is dropped from the file so new
+    entries aren't appended onto it.
+    """
+    titles = set()
+    
+    if not os.path.exists(journal_path):
+        return titles
+    
+    with open(journal_path, 'rb') as f:
+        lines = f.readlines()
+    
+    valid = []
+    for line in lines:
+        try:
+            titles.add(orjson.loads(line).get('title'))
+            valid.append(line if line.endswith(b"\n") else line + b"\n")
+        except orjson.JSONDecodeError:
+            continue
+    
+    if valid != lines:
+        with open(journal_path, 'wb') as f:
+            f.writelines(valid)
+    
+    return titles
+
+def _stringify_nested(scored_df):
+    """
+    Make object columns Arrow-safe
+    
+    Reply fields sometimes come back as JSON arrays/objects (e.g. a list of
+    achievements) or mix types across papers, which Arrow can't write to
+    CSV. Lists and dicts are JSON-encoded and other non-string values
+    stringified; nulls are left alone.
+    """
+    def to_str(value):
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (list, tuple, dict)):
+            return orjson.dumps(value, default=_json_default).decode()
+        if pd.isna(value):
+            return None
+        return str(value)
+    
+    for col in scored_df.columns:
+        if scored_df[col].dtype == object:
+            scored_df[col] = scored_df[col].map(to_str)
+    
+    return scored_df
+
+# Accepted chinese_defense values; everything else maps to NA
+_DEFENSE_FLAG_VALUES = {True: True, False: False, 'true': True, 'false': False, 'True': True, 'False': False}
+
+def _compact_dtypes(scored_df):
+    """
+    Store scores as nullable 1-byte types
+    
+    Scores are small integers (0-10, maturity 1-5) and the defense flag is a
+    boolean, so Int8/boolean cut the Parquet columns and the dashboard's
+    memory 8x compared with int64/object.
+    """
+    for col in ('relevance_score', 'maturity_level', 'credibility_score', 'integration_score'):
+        if col in scored_df:
+            scored_df[col] = pd.to_numeric(scored_df[col], errors='coerce').round().astype('Int8')
+    
+    # Replies occasionally use strings ("false", "unclear"); anything that
+    # isn't a recognisable boolean becomes NA rather than failing the cast
+    if 'chinese_defense' in scored_df:
+        scored_df['chinese_defense'] = scored_df['chinese_defense'].map(_DEFENSE_FLAG_VALUES).astype('boolean')
+    
+    return scored_df
+
+# Abstracts contain newlines; pyarrow's default parser assumes they don't
+# and loses sync with its chunker once a file spans more than one block
+_CSV_PARSE_OPTIONS = pacsv.ParseOptions(newlines_in_values=True)
+
+def _read_papers(input_csv, max_papers=None):
+    """
+    Read papers with pyarrow's CSV reader into an Arrow-backed DataFrame
+    
+    When max_papers is set, record batches are streamed only until enough
+    rows have been read.
+    """
+    
+    if max_papers:
+        reader = pacsv.open_csv(input_csv, parse_options=_CSV_PARSE_OPTIONS)
+        batches = []
+        rows = 0
+        
+        for batch in reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= max_papers:
+                break
+        
+        table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, max_papers)
+    else:
+        table = pacsv.read_csv(input_csv, parse_options=_CSV_PARSE_OPTIONS)
+    
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def score_papers_batch(input_csv, output_csv, max_papers=None, use_cache=True):
     """
     Score a batch of papers from CSV
     
@@ -72,14 +507,15 @@ def score_papers_batch(input_csv, output_csv, max_papers=None):
         input_csv: Path to input CSV with papers
         output_csv: Path to save scored papers
         max_papers: Maximum number to score (None = all)
+        use_cache: Reuse responses from previous runs (data/llm_cache and,
+            if sentence-transformers is installed, data/semantic_cache)
     """
     
+    os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+    
     # Load papers
     print(f"\nLoading papers from: {input_csv}")
-    df = pd.read_csv(input_csv)
-    
-    if max_papers:
-        df = df.head(max_papers)
+    df = _read_papers(input_csv, max_papers)
     
     print(f"Found {len(df)} papers to score")
     
@@ -91,44 +527,135 @@ def score_papers_batch(input_csv, output_csv, max_papers=None):
     
     client = Anthropic(api_key=api_key)
     
-    # Score each paper
-    scored_papers = []
+    # Build paper dicts in one columnar pass rather than a Series per row
+    papers = {str(idx): paper for idx, paper in enumerate(df.to_dict(orient='records'))}
+    
+    # Crash-recovery journal: one JSON line per scored paper, appended as
+    # soon as it is scored and removed once the final files are written
+    journal_path = os.path.splitext(output_csv)[0] + '.jsonl'
+    
+    # Id of a submitted message batch, kept until its results are journaled
+    batch_id_path = os.path.splitext(output_csv)[0] + '.batch'
+    
+    if use_cache:
+        done_titles = _journaled_titles(journal_path)
+        if done_titles:
+            print(f"\nResuming: {len(done_titles)} papers already scored in {journal_path}")
+            papers = {cid: paper for cid, paper in papers.items() if paper.get('title') not in done_titles}
+    else:
+        for path in (journal_path, batch_id_path):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    cache = LLMCache() if use_cache else None
+    semantic_cache = None
+    if use_cache and SemanticCache is not None:
+        # The embedding model may need downloading; scoring works without it
+        try:
+            semantic_cache = SemanticCache()
+        except Exception as e:
+            print(f"⚠️  Semantic cache unavailable ({e}), continuing without it")
     total_tokens = 0
     
-    print("\nScoring papers...\n")
+    # The semantic cache is only held in memory while scoring; write it out
+    # once at the end, even if the run is interrupted
+    try:
+        with open(journal_path, 'ab') as journal:
+            cached_ids = set()
+            
+            # Skip papers whose prompt was already scored in a previous run
+            if cache is not None:
+                for custom_id, paper in papers.items():
+                    cached = cache.get(_cache_prompt(*get_scoring_prompt(paper)))
+                    if cached is None and semantic_cache is not None:
+                        cached = semantic_cache.lookup(paper)
+                    if cached is not None:
+                        _journal_scored_paper(journal, paper, cached)
+                        cached_ids.add(custom_id)
+                print(f"\nReusing cached scores for {len(cached_ids)} papers")
+            
+            pending = {cid: paper for cid, paper in papers.items() if cid not in cached_ids}
+            retry_ids = []
+            
+            # Score remaining papers in one asynchronous batch job
+            if pending:
+                print("\nScoring papers via Message Batches API...\n")
+                
+                try:
+                    batch_scores, retry_ids = score_papers_message_batch(
+                        pending, client, cache, semantic_cache, batch_id_path
+                    )
+                except Exception as e:
+                    print(f"\n⚠️  Message batch failed ({e}), scoring papers one at a time")
+                    batch_scores, retry_ids = {}, list(pending)
+                
+                for custom_id, scores in batch_scores.items():
+                    _journal_scored_paper(journal, papers[custom_id], scores)
+                    total_tokens += scores.get('tokens_used', 0)
+            
+            # Batch results are journaled (or were already cached), so a
+            # rerun must not resume the batch
+            if os.path.exists(batch_id_path):
+                os.remove(batch_id_path)
+            
+            # Fall back to concurrent direct requests for anything the batch could
+            # not score, throttled to the account's rate limits
+            bucket = TokenBucket(TIER_RPM, TIER_ITPM)
+            
+            if retry_ids:
+                print(f"\nScoring {len(retry_ids)} papers directly with {MAX_WORKERS} workers "
+                      f"({TIER_RPM} RPM, {TIER_OTPM} OTPM)")
+            
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(score_paper, papers[custom_id], client, cache, semantic_cache, bucket): custom_id
+                    for custom_id in retry_ids
+                }
+                
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Progress"):
+                    scores = future.result()
+                    
+                    if scores:
+                        _journal_scored_paper(journal, papers[futures[future]], scores)
+                        total_tokens += scores.get('tokens_used', 0)
+    finally:
+        if semantic_cache is not None:
+            semantic_cache.save()
     
-    for idx, row in tqdm(df.iterrows(), total=len(df), desc="Progress"):
-        paper = row.to_dict()
-        
-        scores = score_paper(paper, client)
-        
-        if scores:
-            # Combine original paper data with scores
-            scored_paper = {**paper, **scores}
-            scored_papers.append(scored_paper)
-            total_tokens += scores.get('tokens_used', 0)
-        
-        # Rate limiting: small delay between requests
-        time.sleep(0.5)
+    # Read the journal back once, including papers from a resumed run
+    if os.path.getsize(journal_path) > 0:
+        scored_df = pd.read_json(journal_path, lines=True)
+    else:
+        scored_df = pd.DataFrame()
     
-    # Convert to DataFrame
-    scored_df = pd.DataFrame(scored_papers)
+    scored_df = _compact_dtypes(scored_df)
+    scored_df = _stringify_nested(scored_df)
     
-    # Save results
-    os.makedirs(os.path.dirname(output_csv), exist_ok=True)
-    scored_df.to_csv(output_csv, index=False)
+    # Save results, converting to Arrow once for both the CSV and the
+    # typed columnar copy for the dashboard
+    scored_table = pa.Table.from_pandas(scored_df, preserve_index=False)
+    write_atomic(output_csv, lambda f: pacsv.write_csv(scored_table, f), 'wb')
+    
+    output_parquet = os.path.splitext(output_csv)[0] + '.parquet'
+    write_atomic(output_parquet, lambda f: pq.write_table(scored_table, f, compression='zstd'), 'wb')
+    
+    os.remove(journal_path)
     
     # Print summary
     print("\n" + "="*70)
     print("SCORING COMPLETE")
     print("="*70)
-    print(f"Papers scored: {len(scored_papers)}/{len(df)}")
+    print(f"Papers scored: {len(scored_df)}/{len(df)}")
     print(f"Total tokens used: {total_tokens:,}")
+    print(f"API retries: {_retry_count}")
+    if _output_tokens:
+        print(f"Output tokens per response: avg {sum(_output_tokens) / len(_output_tokens):.0f}, "
+              f"max {max(_output_tokens)} (limit {MAX_TOKENS}, {_truncated_count} truncated)")
     print(f"Estimated cost: ${(total_tokens / 1_000_000) * 3:.4f}")
     print(f"\nSaved to: {output_csv}")
     
     # Show statistics
-    if len(scored_papers) > 0:
+    if len(scored_df) > 0:
         print("\n" + "="*70)
         print("SUMMARY STATISTICS")
         print("="*70)
@@ -165,5 +692,8 @@ if __name__ == '__main__':
     print("="*70)
     print(f"\nUsing curated papers from: {input_file}\n")
     
+    # --no-cache forces every paper to be re-scored
+    use_cache = '--no-cache' not in sys.argv
+    
     # Score all papers (no limit)
-    scored_df = score_papers_batch(input_file, output_file, max_papers=None)
\ No newline at end of file
+    scored_df = score_papers_batch(input_file, output_file, max_papers=None, use_cache=use_cache)
\ No newline at end of file
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Thread-safe token bucket matching Anthropic's per-minute rate limits
+"""
+
+import time
+import threading
+
+class TokenBucket:
+    """
+    Request (RPM) and input-token (ITPM) buckets shared by worker threads
+
+    Anthropic refills capacity continuously rather than resetting it each
+    minute, so both buckets refill at limit/60 per second up to the full
+    per-minute limit.
+    """
+
+    def __init__(self, rpm, itpm):
+        self.rpm = rpm
+        self.itpm = itpm
+
+        self._requests = float(rpm)
+        self._tokens = float(itpm)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.itpm, self._tokens + elapsed * self.itpm / 60)
+        self._updated = now
+
+    def acquire(self, tokens=0):
+        """Block until one request and `tokens` input tokens are available"""
+        # A single request larger than the bucket would otherwise wait forever
+        tokens = min(tokens, self.itpm)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now >= self._paused_until and self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+
+                wait = max(
+                    self._paused_until - now,
+                    (1 - self._requests) * 60 / self.rpm,
+                    (tokens - self._tokens) * 60 / self.itpm,
+                )
+
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Hold back all workers, e.g. for a 429 retry-after period"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -3,15 +3,10 @@
 Scoring rubric for DRL cooperative missile guidance papers
 """
 
-SCORING_PROMPT = """
+# Static rubric sent as a cached system prompt; identical for every paper
+RUBRIC_SYSTEM = """
 You are analyzing a research paper about Deep Reinforcement Learning (DRL) for cooperative missile guidance systems.
 
-Paper Information:
-Title: {title}
-Authors: {authors}
-Published: {published}
-Abstract: {abstract}
-
 Analyze this paper and provide scores on the following dimensions:
 
 1. RELEVANCE (0-10): How directly related is this to DRL-based cooperative missile guidance?
@@ -52,7 +47,7 @@ Analyze this paper and provide scores on the following dimensions:
    - Look for: PLA-affiliated labs
 
 Return your analysis as JSON in this exact format:
-{{
+{
   "relevance_score": <number 0-10>,
   "maturity_level": <number 1-5>,
   "credibility_score": <number 0-10>,
@@ -62,16 +57,35 @@ Return your analysis as JSON in this exact format:
   "chinese_defense": <true/false>,
   "institution_type": "<university/defense_contractor/research_institute/other>",
   "reasoning": "<2-3 sentence explanation of scores>"
-}}
+}
 
 Be objective and precise. Only return the JSON, no other text.
 """
 
+# Marked ephemeral so the rubric prefix can be cached across requests. Sonnet
+# only caches prefixes of at least 1024 tokens and the rubric is ~650, so as
+# written this is a no-op; it takes effect once the rubric grows past that
+RUBRIC_SYSTEM_BLOCKS = [
+    {
+        "type": "text",
+        "text": RUBRIC_SYSTEM,
+        "cache_control": {"type": "ephemeral"}
+    }
+]
+
 def get_scoring_prompt(paper):
-    """Generate scoring prompt for a paper"""
-    return SCORING_PROMPT.format(
-        title=paper.get('title', 'Unknown'),
-        authors=paper.get('authors', 'Unknown'),
-        published=paper.get('published', 'Unknown'),
-        abstract=paper.get('abstract', 'No abstract available')
-    )
\ No newline at end of file
+    """
+    Generate scoring prompt for a paper
+    
+    Returns:
+        Tuple of (system_blocks, user_text)
+    """
+    # Plain f-string: no template parse per paper
+    user_text = (
+        f"Paper Information:\n"
+        f"Title: {paper.get('title', 'Unknown')}\n"
+        f"Authors: {paper.get('authors', 'Unknown')}\n"
+        f"Published: {paper.get('published', 'Unknown')}\n"
+        f"Abstract: {paper.get('abstract', 'No abstract available')}\n"
+    )
+    return RUBRIC_SYSTEM_BLOCKS, user_text
\ No newline at end of file
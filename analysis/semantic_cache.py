@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Embedding-similarity cache so near-duplicate papers reuse prior scores
+"""
+
+import os
+import json
+import threading
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from atomic_write import write_atomic
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Cosine similarity above which two papers are treated as the same work
+SIMILARITY_THRESHOLD = 0.92
+
+def _paper_text(paper):
+    """Text embedded for a paper: title followed by abstract"""
+    return f"{paper.get('title', '')}\n{paper.get('abstract', '')}"
+
+class SemanticCache:
+    """
+    Stores (embedding, scores) pairs for scored papers
+
+    Revisions and preprint/journal pairs have near-identical abstracts, so
+    they miss the exact-prompt LLMCache but land well above the similarity
+    threshold here. Vectors are L2-normalized, so a dot product against the
+    whole matrix gives cosine similarity; at a few thousand papers a flat
+    numpy search is fast enough that an ANN index isn't worth it.
+    """
+
+    def __init__(self, cache_dir="data/semantic_cache", threshold=SIMILARITY_THRESHOLD):
+        self.cache_dir = cache_dir
+        self.threshold = threshold
+        self.model = SentenceTransformer(EMBEDDING_MODEL)
+        self._lock = threading.Lock()
+
+        self._embeddings_path = os.path.join(cache_dir, "embeddings.npy")
+        self._scores_path = os.path.join(cache_dir, "scores.json")
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+        dim = self.model.get_sentence_embedding_dimension()
+        self.embeddings = np.empty((0, dim), dtype=np.float32)
+        self.scores = []
+
+        # Vectors added this run, and vectors from missed lookups by paper
+        # text (consumed by add())
+        self._new_embeddings = []
+        self._pending_embeddings = {}
+
+        try:
+            embeddings = np.load(self._embeddings_path)
+            with open(self._scores_path, encoding='utf-8') as f:
+                scores = json.load(f)
+        except (OSError, EOFError, ValueError):
+            # Missing or corrupt files (json.JSONDecodeError is a ValueError):
+            # start over rather than fail the scoring run
+            return
+
+        # A crash between the two writes can leave the files out of step,
+        # and a mismatch would pair embeddings with the wrong scores
+        if embeddings.shape == (len(scores), dim):
+            self.embeddings = embeddings
+            self.scores = scores
+        else:
+            print(f"⚠️  Ignoring inconsistent semantic cache in {cache_dir}")
+
+    def _embed(self, paper):
+        """Embedding for a paper, reusing the one computed by a missed lookup"""
+        text = _paper_text(paper)
+        embedding = self._pending_embeddings.pop(text, None)
+        if embedding is None:
+            embedding = self.model.encode(text, normalize_embeddings=True).astype(np.float32)
+        return text, embedding
+
+    def lookup(self, paper):
+        """
+        Find scores for a near-duplicate paper
+
+        On a miss the embedding is kept so add() for the same paper doesn't
+        encode it again.
+
+        Returns:
+            Copy of the stored scores tagged cache_source="semantic", or None
+        """
+        with self._lock:
+            text, embedding = self._embed(paper)
+
+            if not self.scores or len(self.scores) != len(self.embeddings) + len(self._new_embeddings):
+                self._pending_embeddings[text] = embedding
+                return None
+
+            similarities = self.embeddings @ embedding
+            if self._new_embeddings:
+                similarities = np.concatenate([similarities, np.array(self._new_embeddings) @ embedding])
+            best = int(np.argmax(similarities))
+
+            if similarities[best] < self.threshold:
+                self._pending_embeddings[text] = embedding
+                return None
+
+            return {**self.scores[best], 'cache_source': 'semantic'}
+
+    def add(self, paper, scores):
+        """Insert a scored paper (in memory only; call save() to persist)"""
+        scores = {k: v for k, v in scores.items() if k not in ('tokens_used', 'cache_source')}
+
+        with self._lock:
+            _, embedding = self._embed(paper)
+            # Stacked once in save() rather than copying the matrix per insert
+            self._new_embeddings.append(embedding)
+            self.scores.append(scores)
+
+    def save(self):
+        """Write the cache to disk, replacing both files atomically"""
+        with self._lock:
+            if not self._new_embeddings:
+                return
+
+            self.embeddings = np.vstack([self.embeddings, *self._new_embeddings])
+            self._new_embeddings = []
+
+            write_atomic(self._embeddings_path, lambda f: np.save(f, self.embeddings), 'wb')
+            write_atomic(self._scores_path, lambda f: json.dump(self.scores, f))
@@ -6,6 +6,8 @@ import pandas as pd
 from datetime import datetime
 import os
 
+client = arxiv.Client(page_size=100, num_retries=3)
+
 def search_arxiv(query, max_results=20):
     print(f"Searching: {query}")
     
@@ -16,7 +18,7 @@ def search_arxiv(query, max_results=20):
     )
     
     papers = []
-    for result in search.results():
+    for result in client.results(search):
         paper = {
             'title': result.title,
             'authors': ', '.join([a.name for a in result.authors]),
@@ -37,13 +39,12 @@ def main():
         'distributed UAV swarm control'
     ]
     
-    all_papers = []
     print("\nCollecting papers...\n")
     
-    for query in queries:
-        papers = search_arxiv(query, max_results=15)
-        all_papers.extend(papers)
-        print(f"  Found {len(papers)} papers\n")
+    # One OR-joined request instead of a round-trip per query
+    combined = ' OR '.join(f'({q})' for q in queries)
+    all_papers = search_arxiv(combined, max_results=15 * len(queries))
+    print(f"  Found {len(all_papers)} papers\n")
     
     df = pd.DataFrame(all_papers)
     df = df.drop_duplicates(subset=['url'])
@@ -5,6 +5,9 @@ Interactive Dashboard for DRL Cooperative Missile Guidance Tracker
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
@@ -17,16 +20,61 @@ st.set_page_config(
     layout="wide"
 )
 
+# Columns the dashboard renders; the large abstract column is never loaded
+DASHBOARD_COLUMNS = [
+    'title',
+    'authors',
+    'relevance_score',
+    'maturity_level',
+    'credibility_score',
+    'integration_score',
+    'published',
+    'chinese_defense',
+    'achievements',
+    'limitations',
+    'reasoning',
+    'url'
+]
+
+# Compact dtypes for the score columns (matches what paper_scorer writes)
+SCORE_DTYPES = {
+    'relevance_score': 'int8[pyarrow]',
+    'maturity_level': 'int8[pyarrow]',
+    'credibility_score': 'int8[pyarrow]',
+    'integration_score': 'int8[pyarrow]',
+    'chinese_defense': 'bool[pyarrow]'
+}
+
 # Load data
 @st.cache_data
 def load_data():
     """Load scored papers data"""
     scored_file = 'data/processed/scored_papers.csv'
-    
-    if not os.path.exists(scored_file):
+    parquet_file = 'data/processed/scored_papers.parquet'
+    
+    # Prefer the Parquet copy unless the CSV has been updated since
+    if os.path.exists(parquet_file) and (
+        not os.path.exists(scored_file)
+        or os.path.getmtime(parquet_file) >= os.path.getmtime(scored_file)
+    ):
+        df = pd.read_parquet(
+            parquet_file,
+            engine='pyarrow',
+            dtype_backend='pyarrow',
+            columns=DASHBOARD_COLUMNS
+        )
+    elif os.path.exists(scored_file):
+        # The default C engine handles quoted multi-line abstracts, which the
+        # pyarrow engine rejects; usecols still skips the unused text columns
+        df = pd.read_csv(
+            scored_file,
+            dtype_backend='pyarrow',
+            usecols=DASHBOARD_COLUMNS
+        )
+    else:
         return None
     
-    df = pd.read_csv(scored_file)
+    df = df.astype(SCORE_DTYPES)
     
     # Parse publication dates
     df['published'] = pd.to_datetime(df['published'], errors='coerce')
@@ -34,6 +82,59 @@ def load_data():
     
     return df
 
+# Aggregates below are cached per filter state, so a rerun with unchanged
+# filters (e.g. expanding a paper) does no pandas work. Filters are passed
+# as (min_relevance, tuple of maturity levels) to keep cache keys hashable.
+@st.cache_data
+def filter_papers(min_relevance, selected_maturity):
+    """Papers matching the sidebar filters"""
+    df = load_data()
+    return df[
+        (df['relevance_score'] >= min_relevance) &
+        (df['maturity_level'].isin(selected_maturity))
+    ]
+
+@st.cache_data
+def compute_summary(min_relevance, selected_maturity):
+    """Executive summary metrics for the filtered papers"""
+    filtered_df = filter_papers(min_relevance, selected_maturity)
+    return {
+        'avg_relevance': filtered_df['relevance_score'].mean(),
+        'avg_maturity': filtered_df['maturity_level'].mean(),
+        # Arrow-backed columns: sum in Arrow's C kernels, no pandas dispatch
+        'chinese_defense_count': pc.sum(pa.array(filtered_df['chinese_defense'])).as_py() or 0
+    }
+
+@st.cache_data
+def relevance_histogram(min_relevance, selected_maturity):
+    """Number of filtered papers per relevance score (0-10)"""
+    filtered_df = filter_papers(min_relevance, selected_maturity)
+    scores = filtered_df['relevance_score'].dropna().to_numpy(dtype=np.int8)
+    counts = np.bincount(np.clip(scores, 0, 10), minlength=11)
+    return np.arange(len(counts)), counts
+
+@st.cache_data
+def count_by_maturity(min_relevance, selected_maturity):
+    """Number of filtered papers per maturity level (TRL 1-5)"""
+    filtered_df = filter_papers(min_relevance, selected_maturity)
+    levels = filtered_df['maturity_level'].dropna().to_numpy(dtype=np.int8)
+    counts = np.bincount(levels, minlength=6)
+    return np.arange(1, len(counts)), counts[1:]
+
+@st.cache_data
+def count_by_year(min_relevance, selected_maturity):
+    """Number of filtered papers per publication year"""
+    filtered_df = filter_papers(min_relevance, selected_maturity)
+    return filtered_df['year'].value_counts().sort_index()
+
+@st.cache_data
+def top_papers_by_relevance(min_relevance, selected_maturity, top_n):
+    """The top_n most relevant filtered papers"""
+    filtered_df = filter_papers(min_relevance, selected_maturity)
+    scores = pa.array(filtered_df['relevance_score'])
+    idx = pc.top_k_unstable(scores, k=min(top_n, len(filtered_df)))
+    return filtered_df.take(idx.to_numpy())
+
 # Main dashboard
 def main():
     # Title and header
@@ -62,18 +163,16 @@ def main():
     
     # Maturity filter
     maturity_options = sorted(df['maturity_level'].dropna().unique())
-    selected_maturity = st.sidebar.multiselect(
+    selected_maturity = tuple(st.sidebar.multiselect(
         "Technology Maturity Level",
         options=maturity_options,
         default=maturity_options,
         help="TRL 1=Theory, 5=Operational"
-    )
+    ))
     
     # Apply filters
-    filtered_df = df[
-        (df['relevance_score'] >= min_relevance) &
-        (df['maturity_level'].isin(selected_maturity))
-    ]
+    filtered_df = filter_papers(min_relevance, selected_maturity)
+    summary = compute_summary(min_relevance, selected_maturity)
     
     # Executive Summary
     st.header("📊 Executive Summary")
@@ -88,7 +187,7 @@ def main():
         )
     
     with col2:
-        avg_relevance = filtered_df['relevance_score'].mean()
+        avg_relevance = summary['avg_relevance']
         st.metric(
             "Avg Relevance",
             f"{avg_relevance:.1f}/10",
@@ -96,7 +195,7 @@ def main():
         )
     
     with col3:
-        avg_maturity = filtered_df['maturity_level'].mean()
+        avg_maturity = summary['avg_maturity']
         st.metric(
             "Avg Maturity",
             f"{avg_maturity:.1f}/5",
@@ -104,7 +203,7 @@ def main():
         )
     
     with col4:
-        chinese_defense_count = filtered_df['chinese_defense'].sum()
+        chinese_defense_count = summary['chinese_defense_count']
         chinese_defense_pct = (chinese_defense_count / len(filtered_df) * 100) if len(filtered_df) > 0 else 0
         st.metric(
             "Defense Connection",
@@ -121,31 +220,38 @@ def main():
     with col1:
         st.subheader("📈 Relevance Distribution")
         
-        fig = px.histogram(
-            filtered_df,
-            x='relevance_score',
-            nbins=10,
+        # Counts are computed once per filter state and plotted as plain bars
+        scores, counts = relevance_histogram(min_relevance, selected_maturity)
+        
+        fig = go.Figure(go.Bar(
+            x=scores,
+            y=counts,
+            marker_color='#1f77b4'
+        ))
+        fig.update_layout(
             title="Distribution of Relevance Scores",
-            labels={'relevance_score': 'Relevance Score', 'count': 'Number of Papers'},
-            color_discrete_sequence=['#1f77b4']
+            xaxis_title='Relevance Score',
+            yaxis_title='Number of Papers',
+            showlegend=False
         )
-        fig.update_layout(showlegend=False)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("🎯 Technology Maturity Levels")
         
-        maturity_counts = filtered_df['maturity_level'].value_counts().sort_index()
+        levels, maturity_counts = count_by_maturity(min_relevance, selected_maturity)
         
-        fig = px.bar(
-            x=maturity_counts.index,
-            y=maturity_counts.values,
+        fig = go.Figure(go.Bar(
+            x=levels,
+            y=maturity_counts,
+            marker=dict(color=maturity_counts, colorscale='Viridis', showscale=True)
+        ))
+        fig.update_layout(
             title="Papers by TRL Maturity Level",
-            labels={'x': 'TRL Level', 'y': 'Number of Papers'},
-            color=maturity_counts.values,
-            color_continuous_scale='Viridis'
+            xaxis_title='TRL Level',
+            yaxis_title='Number of Papers',
+            showlegend=False
         )
-        fig.update_layout(showlegend=False)
         st.plotly_chart(fig, use_container_width=True)
     
     # Charts row 2
@@ -155,7 +261,7 @@ def main():
         st.subheader("📅 Publication Timeline")
         
         if 'year' in filtered_df.columns:
-            year_counts = filtered_df['year'].value_counts().sort_index()
+            year_counts = count_by_year(min_relevance, selected_maturity)
             
             fig = px.line(
                 x=year_counts.index,
@@ -193,7 +299,7 @@ def main():
     
     top_n = st.slider("Number of papers to display", 3, 10, 5)
     
-    top_papers = filtered_df.nlargest(top_n, 'relevance_score')
+    top_papers = top_papers_by_relevance(min_relevance, selected_maturity, top_n)
     
     for idx, row in top_papers.iterrows():
         with st.expander(f"**{row['title']}** (Relevance: {row['relevance_score']}/10)"):
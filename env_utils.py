@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""Shared .env loading for the setup and API test scripts"""
+
+import os
+from functools import lru_cache
+from dotenv import load_dotenv
+
+@lru_cache(maxsize=1)
+def get_api_key():
+    """Load .env once and return ANTHROPIC_API_KEY (None if unset)"""
+    load_dotenv()
+    return os.getenv("ANTHROPIC_API_KEY")
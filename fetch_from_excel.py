@@ -6,49 +6,101 @@ import arxiv
 from scholarly import scholarly
 import time
 import os
+import re
 from tqdm import tqdm
 
-def search_paper_by_title(title):
+# Titles looked up per arXiv request
+ARXIV_BATCH_SIZE = 20
+
+# arXiv asks for at most one request every 3 seconds; the client enforces it
+arxiv_client = arxiv.Client(page_size=100, delay_seconds=3, num_retries=3)
+
+def _normalize_title(title):
+    return re.sub(r'\W+', ' ', title.lower()).strip()
+
+def _arxiv_paper(result, title):
+    """Build paper dict from an arXiv result found for `title`"""
+    return {
+        'title': result.title,
+        'authors': ', '.join([a.name for a in result.authors]),
+        'abstract': result.summary,
+        'published': result.published.strftime('%Y-%m-%d'),
+        'url': result.entry_id,
+        'categories': ', '.join(result.categories),
+        'source': 'arxiv',
+        'search_title': title,
+        'match_quality': 'exact' if title.lower() in result.title.lower() else 'partial'
+    }
+
+def search_arxiv_titles(titles):
     """
-    Search for paper by title on arXiv and Google Scholar
+    Look up many titles on arXiv, several per request
+    
+    Each request ORs together title phrase queries, so every returned
+    result has to be matched back to a search title. A result only counts
+    if the normalized search title appears in its normalized title (the
+    same guarantee a single phrase query gives), and each result is
+    assigned to at most one search title.
     
     Args:
-        title: Paper title string
+        titles: List of paper title strings
     
     Returns:
-        Dictionary with paper data or None
+        Dictionary mapping search title -> paper data (missing if not found)
     """
     
-    print(f"\nSearching: {title[:70]}...")
+    found = {}
     
-    # Try arXiv first (faster and more reliable)
-    try:
-        search = arxiv.Search(
-            query=f'ti:"{title}"',
-            max_results=3
-        )
+    for start in range(0, len(titles), ARXIV_BATCH_SIZE):
+        chunk = titles[start:start + ARXIV_BATCH_SIZE]
+        print(f"\nSearching arXiv for titles {start + 1}-{start + len(chunk)} of {len(titles)}...")
         
-        results = list(search.results())
+        # Quotes would end the phrase query early
+        query = ' OR '.join('ti:"{}"'.format(title.replace('"', '')) for title in chunk)
         
-        if results:
-            result = results[0]  # Take first match
-            paper = {
-                'title': result.title,
-                'authors': ', '.join([a.name for a in result.authors]),
-                'abstract': result.summary,
-                'published': result.published.strftime('%Y-%m-%d'),
-                'url': result.entry_id,
-                'categories': ', '.join(result.categories),
-                'source': 'arxiv',
-                'search_title': title,
-                'match_quality': 'exact' if title.lower() in result.title.lower() else 'partial'
-            }
-            print(f"  ✓ Found on arXiv: {result.title[:60]}...")
-            return paper
-    except Exception as e:
-        print(f"  ⚠️  arXiv search failed: {e}")
+        try:
+            search = arxiv.Search(query=query, max_results=len(chunk) * 3)
+            results = list(arxiv_client.results(search))
+        except Exception as e:
+            print(f"  ⚠️  arXiv search failed: {e}")
+            continue
+        
+        normalized = [(r, _normalize_title(r.title)) for r in results]
+        used = set()
+        
+        for title in chunk:
+            target = _normalize_title(title)
+            if not target:
+                continue
+            
+            # Shortest containing title is the closest match, e.g. the paper
+            # itself rather than a follow-up that quotes its title
+            candidates = [
+                (len(result_title), i) for i, (result, result_title) in enumerate(normalized)
+                if i not in used and target in result_title
+            ]
+            if not candidates:
+                continue
+            
+            _, i = min(candidates)
+            used.add(i)
+            best = normalized[i][0]
+            found[title] = _arxiv_paper(best, title)
+            print(f"  ✓ Found on arXiv: {best.title[:60]}...")
+    
+    return found
+
+def search_google_scholar(title):
+    """
+    Search for paper by title on Google Scholar
+    
+    Args:
+        title: Paper title string
+    
+    Returns:
+        Dictionary with paper data or None
+    """
     
-    # Try Google Scholar as backup
     try:
         print(f"  Trying Google Scholar...")
         search_query = scholarly.search_pubs(title)
@@ -69,9 +121,31 @@ def search_paper_by_title(title):
         return paper
     except Exception as e:
         print(f"  ⚠️  Google Scholar search failed: {e}")
+        return None
+
+def search_paper_by_title(title):
+    """
+    Search for paper by title on arXiv and Google Scholar
+    
+    Args:
+        title: Paper title string
     
-    print(f"  ❌ Not found")
-    return None
+    Returns:
+        Dictionary with paper data or None
+    """
+    
+    print(f"\nSearching: {title[:70]}...")
+    
+    # Try arXiv first (faster and more reliable)
+    paper = search_arxiv_titles([title]).get(title)
+    
+    # Try Google Scholar as backup
+    if paper is None:
+        paper = search_google_scholar(title)
+    
+    if paper is None:
+        print(f"  ❌ Not found")
+    return paper
 
 def fetch_papers_from_excel(excel_file):
     """
@@ -121,18 +195,24 @@ def fetch_papers_from_excel(excel_file):
     print("Fetching paper details...")
     print("="*70)
     
+    # arXiv first, many titles per request
+    arxiv_papers = search_arxiv_titles(titles)
+    
     for idx, title in enumerate(titles, 1):
-        print(f"\n[{idx}/{len(titles)}]", end=" ")
+        paper = arxiv_papers.get(title)
         
-        paper = search_paper_by_title(title)
+        if paper is None:
+            print(f"\n[{idx}/{len(titles)}] Searching: {title[:70]}...")
+            paper = search_google_scholar(title)
+            
+            # Rate limiting to avoid being blocked
+            time.sleep(3)
         
         if paper:
             papers.append(paper)
         else:
+            print(f"  ❌ Not found")
             not_found.append(title)
-        
-        # Rate limiting to avoid being blocked
-        time.sleep(3)
     
     # Save found papers
     print("\n" + "="*70)
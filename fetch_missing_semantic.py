@@ -2,44 +2,58 @@
 """Try to find missing papers using Semantic Scholar"""
 
 import pandas as pd
-import requests
-import time
+import asyncio
+import os
+import aiohttp
+from aiolimiter import AsyncLimiter
+from dotenv import load_dotenv
 from tqdm import tqdm
 
-def search_semantic_scholar(title):
+# Load environment
+load_dotenv()
+
+# Title match endpoint returns the single closest paper
+SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search/match"
+
+# Optional API key raises the rate limit from ~1 to 10 requests/second
+API_KEY = os.getenv("S2_API_KEY")
+REQUESTS_PER_SECOND = 10 if API_KEY else 1
+
+# Maximum requests in flight at once
+MAX_CONCURRENT = 5
+
+async def search_semantic_scholar(session, limiter, title):
     """Search Semantic Scholar for a paper by title"""
     
-    url = "https://api.semanticscholar.org/graph/v1/paper/search"
-    
     params = {
         'query': title,
-        'fields': 'title,authors,abstract,year,url,venue,publicationTypes',
-        'limit': 3
+        'fields': 'title,authors,abstract,year,url,venue,publicationTypes'
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        async with limiter:
+            async with session.get(SEARCH_URL, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status != 200:
+                    return None
+                data = await response.json()
         
-        if response.status_code == 200:
-            data = response.json()
+        if data.get('data') and len(data['data']) > 0:
+            result = data['data'][0]  # Take first match
             
-            if data.get('data') and len(data['data']) > 0:
-                result = data['data'][0]  # Take first match
-                
-                # Extract author names
-                authors = ', '.join([a.get('name', 'Unknown') for a in result.get('authors', [])])
-                
-                paper = {
-                    'title': result.get('title', title),
-                    'authors': authors,
-                    'abstract': result.get('abstract', 'Abstract not available'),
-                    'published': str(result.get('year', 'Unknown')),
-                    'url': result.get('url', 'No URL'),
-                    'categories': result.get('venue', 'Not specified'),
-                    'source': 'semantic_scholar'
-                }
-                
-                return paper
+            # Extract author names
+            authors = ', '.join([a.get('name', 'Unknown') for a in result.get('authors', [])])
+            
+            paper = {
+                'title': result.get('title', title),
+                'authors': authors,
+                'abstract': result.get('abstract', 'Abstract not available'),
+                'published': str(result.get('year', 'Unknown')),
+                'url': result.get('url', 'No URL'),
+                'categories': result.get('venue', 'Not specified'),
+                'source': 'semantic_scholar'
+            }
+            
+            return paper
         
         return None
         
@@ -47,6 +61,37 @@ def search_semantic_scholar(title):
         print(f"Error: {e}")
         return None
 
+async def search_titles(titles):
+    """
+    Search all titles concurrently, reporting each result as it arrives
+    
+    Returns results in the same order as titles
+    """
+    
+    headers = {'x-api-key': API_KEY} if API_KEY else None
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    limiter = AsyncLimiter(REQUESTS_PER_SECOND, 1)
+    
+    async def fetch_one(session, idx, title):
+        async with semaphore:
+            return idx, await search_semantic_scholar(session, limiter, title)
+    
+    results = [None] * len(titles)
+    
+    async with aiohttp.ClientSession(headers=headers) as session:
+        tasks = [fetch_one(session, idx, title) for idx, title in enumerate(titles)]
+        
+        # At 1 request/second a long list takes minutes, so show progress
+        # as lookups finish rather than once they all have
+        for done, future in enumerate(asyncio.as_completed(tasks), 1):
+            idx, paper = await future
+            results[idx] = paper
+            
+            print(f"\n[{done}/{len(titles)}] {titles[idx][:60]}...")
+            print("  ✓ Found!" if paper else "  ✗ Not found")
+    
+    return results
+
 def fetch_missing_papers():
     """Try to fetch papers that weren't found previously"""
     
@@ -68,19 +113,13 @@ def fetch_missing_papers():
     found_papers = []
     still_not_found = []
     
-    for idx, title in enumerate(titles, 1):
-        print(f"\n[{idx}/{len(titles)}] {title[:60]}...")
-        
-        paper = search_semantic_scholar(title)
-        
+    results = asyncio.run(search_titles(titles))
+    
+    for title, paper in zip(titles, results):
         if paper:
             found_papers.append(paper)
-            print(f"  ✓ Found!")
         else:
             still_not_found.append(title)
-            print(f"  ✗ Not found")
-        
-        time.sleep(1)  # Rate limiting
     
     # Save newly found papers
     if found_papers:
@@ -2,29 +2,79 @@
 """Inspect collected and scored papers"""
 
 import pandas as pd
-import glob
 import os
+import sys
+
+# pyarrow's multithreaded CSV reader is used for full-file passes when present
+try:
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Columns shown for each sample scored paper (chinese_defense/reasoning
+# may be missing from older files, so they're selected leniently)
+SCORED_SAMPLE_COLUMNS = ['title', 'relevance_score', 'maturity_level', 'chinese_defense', 'reasoning']
+
+def _count_rows(csv_file, column='title', chunksize=10_000):
+    """
+    Count CSV records, parsing a single column
+    
+    Counting b'\n' bytes would be faster but overcounts, since quoted
+    abstracts contain embedded newlines. With pyarrow the column is read as
+    a compact Arrow array; otherwise pandas parses it in constant-memory
+    chunks.
+    """
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            csv_file,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(include_columns=[column])
+        )
+        return table.num_rows
+    
+    return sum(len(chunk) for chunk in pd.read_csv(csv_file, usecols=[column], chunksize=chunksize))
 
 def inspect_raw_papers():
     """Look at raw collected papers"""
-    csv_files = glob.glob('data/raw/arxiv_papers_*.csv')
+    # Single directory pass; DirEntry caches is_file/stat results
+    latest, latest_ctime = None, -1
     
-    if not csv_files:
+    try:
+        with os.scandir('data/raw') as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('arxiv_papers_') and name.endswith('.csv') and entry.is_file(follow_symlinks=False):
+                    ctime = entry.stat().st_ctime
+                    if ctime > latest_ctime:
+                        latest_ctime, latest = ctime, entry.path
+    except FileNotFoundError:
+        pass
+    
+    if latest is None:
         print("No papers found")
         return
     
-    latest = max(csv_files, key=os.path.getctime)
-    df = pd.read_csv(latest)
+    total = _count_rows(latest)
+    # pandas' pyarrow engine can't stop after nrows, so the 10-row sample
+    # stays on the C engine
+    df = pd.read_csv(latest, usecols=['title', 'categories', 'abstract'], nrows=10)
+    
+    # Output is collected and written once rather than a print() per line
+    lines = [
+        "="*70,
+        f"RAW COLLECTED PAPERS ({total} total)",
+        "="*70,
+        "\nFirst 10 paper titles:"
+    ]
     
-    print("="*70)
-    print(f"RAW COLLECTED PAPERS ({len(df)} total)")
-    print("="*70)
+    # Plain tuples; no Series is built per row
+    sample = df[['title', 'categories', 'abstract']]
+    for i, (title, categories, abstract) in enumerate(sample.itertuples(index=False, name=None), 1):
+        lines.append(f"\n{i}. {title}")
+        lines.append(f"   Categories: {categories}")
+        lines.append(f"   Abstract preview: {abstract[:150]}...")
     
-    print("\nFirst 10 paper titles:")
-    for idx, row in df.head(10).iterrows():
-        print(f"\n{idx+1}. {row['title']}")
-        print(f"   Categories: {row['categories']}")
-        print(f"   Abstract preview: {row['abstract'][:150]}...")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def inspect_scored_papers():
     """Look at scored papers"""
@@ -34,26 +84,44 @@ def inspect_scored_papers():
         print("No scored papers found")
         return
     
-    df = pd.read_csv(scored_file)
+    # Only the two score columns are needed for the distribution, and they
+    # give the row count too without a separate pass over the file
+    df = pd.read_csv(scored_file, usecols=['relevance_score', 'maturity_level'])
+    
+    lines = [
+        "\n" + "="*70,
+        f"SCORED PAPERS ({len(df)} total)",
+        "="*70
+    ]
+    
+    # Reduce over the raw ndarrays rather than through Series methods
+    rel = df['relevance_score'].dropna().to_numpy()
+    mat = df['maturity_level'].dropna().to_numpy()
+    
+    lines.append("\nScore Distribution:")
+    if rel.size:
+        lines.append(f"Relevance: min={rel.min()}, max={rel.max()}, avg={rel.mean():.1f}")
+    if mat.size:
+        lines.append(f"Maturity: min={mat.min()}, max={mat.max()}, avg={mat.mean():.1f}")
     
-    print("\n" + "="*70)
-    print(f"SCORED PAPERS ({len(df)} total)")
-    print("="*70)
+    lines += [
+        "\n" + "="*70,
+        "SAMPLE SCORED PAPERS:",
+        "="*70
+    ]
     
-    print("\nScore Distribution:")
-    print(f"Relevance: min={df['relevance_score'].min()}, max={df['relevance_score'].max()}, avg={df['relevance_score'].mean():.1f}")
-    print(f"Maturity: min={df['maturity_level'].min()}, max={df['maturity_level'].max()}, avg={df['maturity_level'].mean():.1f}")
+    sample = pd.read_csv(scored_file, usecols=lambda c: c in SCORED_SAMPLE_COLUMNS, nrows=5)
+    sample = sample.reindex(columns=SCORED_SAMPLE_COLUMNS)
+    sample[['chinese_defense', 'reasoning']] = sample[['chinese_defense', 'reasoning']].astype(object).fillna('N/A')
     
-    print("\n" + "="*70)
-    print("SAMPLE SCORED PAPERS:")
-    print("="*70)
+    for i, (title, relevance, maturity, chinese_defense, reasoning) in enumerate(sample.itertuples(index=False, name=None), 1):
+        lines.append(f"\n{i}. {title[:70]}...")
+        lines.append(f"   Relevance: {relevance}/10")
+        lines.append(f"   Maturity: {maturity}/5")
+        lines.append(f"   Chinese Defense: {chinese_defense}")
+        lines.append(f"   Reasoning: {reasoning[:200]}...")
     
-    for idx, row in df.head(5).iterrows():
-        print(f"\n{idx+1}. {row['title'][:70]}...")
-        print(f"   Relevance: {row['relevance_score']}/10")
-        print(f"   Maturity: {row['maturity_level']}/5")
-        print(f"   Chinese Defense: {row.get('chinese_defense', 'N/A')}")
-        print(f"   Reasoning: {row.get('reasoning', 'N/A')[:200]}...")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == '__main__':
     inspect_raw_papers()
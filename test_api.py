@@ -1,27 +1,37 @@
 #!/usr/bin/env python3
 """Test API connection"""
 
-import os
-from dotenv import load_dotenv
+import sys
+from functools import lru_cache
 from anthropic import Anthropic
 
+from env_utils import get_api_key
+
+@lru_cache(maxsize=1)
+def _client():
+    """Shared client so repeat calls reuse its connection pool and TLS session"""
+    api_key = get_api_key()
+    if not api_key:
+        raise RuntimeError("ANTHROPIC_API_KEY is not set")
+    return Anthropic(api_key=api_key)
+
 def test_api():
-    load_dotenv()
-    
-    api_key = os.getenv("ANTHROPIC_API_KEY")
+    api_key = get_api_key()
     
     if not api_key:
-        print("❌ No API key found")
-        print("Make sure .env file exists with ANTHROPIC_API_KEY")
+        sys.stdout.write("❌ No API key found\n"
+                         "Make sure .env file exists with ANTHROPIC_API_KEY\n")
         return False
     
-    print(f"✓ API key loaded")
-    print(f"  Starts with: {api_key[:20]}...")
-    print(f"  Length: {len(api_key)} characters")
+    sys.stdout.write(
+        "✓ API key loaded\n"
+        f"  Starts with: {api_key[:20]}...\n"
+        f"  Length: {len(api_key)} characters\n"
+    )
     
-    print("\nTesting API connection...")
+    sys.stdout.write("\nTesting API connection...\n")
     try:
-        client = Anthropic(api_key=api_key)
+        client = _client()
         message = client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=50,
@@ -31,20 +41,19 @@ def test_api():
         )
         
         response = message.content[0].text
-        print(f"✓ API Response: {response}")
-        print(f"\n✅ API connection working!")
-        print(f"✓ Used {message.usage.input_tokens} input tokens, {message.usage.output_tokens} output tokens")
-        print(f"✓ Cost: ~$0.0001")
+        sys.stdout.write(
+            f"✓ API Response: {response}\n"
+            "\n✅ API connection working!\n"
+            f"✓ Used {message.usage.input_tokens} input tokens, {message.usage.output_tokens} output tokens\n"
+            "✓ Cost: ~$0.0001\n"
+        )
         return True
         
     except Exception as e:
-        print(f"\n❌ API call failed:")
-        print(f"   {e}")
+        sys.stdout.write(f"\n❌ API call failed:\n   {e}\n")
         return False
 
 if __name__ == '__main__':
-    print("="*60)
-    print("Testing Anthropic API Connection")
-    print("="*60 + "\n")
+    sys.stdout.write("="*60 + "\nTesting Anthropic API Connection\n" + "="*60 + "\n\n")
     test_api()
-    print("\n" + "="*60)
\ No newline at end of file
+    sys.stdout.write("\n" + "="*60 + "\n")
\ No newline at end of file
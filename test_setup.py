@@ -1,69 +1,109 @@
 #!/usr/bin/env python3
 """Test that all packages installed correctly"""
 
-import os
-from dotenv import load_dotenv
+import sys
+import importlib
+import importlib.util
 
-def test_imports():
-    """Test all required packages"""
-    packages = [
-        'pandas',
-        'numpy', 
-        'requests',
-        'feedparser',
-        'networkx',
-        'plotly',
-        'streamlit',
-        'anthropic',
-        'sqlalchemy',
-        'arxiv'
-    ]
+from env_utils import get_api_key
+
+# Required packages, checked in this order
+PACKAGES = (
+    'pandas',
+    'numpy',
+    'requests',
+    'feedparser',
+    'networkx',
+    'plotly',
+    'streamlit',
+    'anthropic',
+    'sqlalchemy',
+    'arxiv'
+)
+
+def _find(package):
+    """Check a package is installed without executing it"""
+    if importlib.util.find_spec(package) is None:
+        return "not installed"
+    return None
+
+def _probe(package):
+    """Import a package, returning an error message or None"""
+    try:
+        importlib.import_module(package)
+        return None
+    except Exception as e:
+        # Broken installs fail in their init code with all kinds of errors
+        return str(e)
+
+def test_imports(deep=False):
+    """
+    Test all required packages
     
-    print("Testing package imports...\n")
+    By default only checks each package can be found. With deep=True every
+    package is actually imported, which also catches broken installs (e.g.
+    a missing shared library) at the cost of running their init code.
+    """
+    sys.stdout.write("Testing package imports...\n\n")
     failed = []
     
-    for package in packages:
-        try:
-            __import__(package)
-            print(f"✓ {package}")
-        except ImportError as e:
-            print(f"✗ {package} - FAILED: {e}")
+    # Packages already imported in this process (e.g. under pytest) need
+    # neither a finder lookup nor the import lock
+    to_check = [package for package in PACKAGES if package not in sys.modules]
+    
+    # Deep imports run one at a time in PACKAGES order: packages import each
+    # other (plotly imports pandas), so importing them in parallel threads can
+    # expose a partially initialized module
+    check = _probe if deep else _find
+    errors = {package: check(package) for package in to_check}
+    
+    # Report is collected and written once rather than a print() per line
+    lines = []
+    
+    for package in PACKAGES:
+        if package not in errors:
+            lines.append(f"✓ {package} (cached)")
+            continue
+        
+        error = errors[package]
+        if error is None:
+            lines.append(f"✓ {package}")
+        else:
+            lines.append(f"✗ {package} - FAILED: {error}")
             failed.append(package)
     
-    print("\n" + "="*50)
+    lines.append("\n" + "="*50)
     if not failed:
-        print(f"✅ SUCCESS! All {len(packages)} packages imported correctly")
-        return True
+        lines.append(f"✅ SUCCESS! All {len(PACKAGES)} packages {'imported' if deep else 'found'} correctly")
     else:
-        print(f"❌ {len(failed)} packages failed")
-        print(f"Failed: {', '.join(failed)}")
-        return False
+        lines.append(f"❌ {len(failed)} packages failed")
+        lines.append(f"Failed: {', '.join(failed)}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return not failed
 
 def test_api():
     """Test API key is configured"""
-    load_dotenv()
-    api_key = os.getenv("ANTHROPIC_API_KEY")
+    api_key = get_api_key()
     
     if api_key and api_key.startswith("sk-ant-"):
-        print("✅ API key configured correctly")
+        sys.stdout.write("✅ API key configured correctly\n")
         return True
     else:
-        print("❌ API key not found or invalid")
-        print("Make sure .env file exists with ANTHROPIC_API_KEY")
+        sys.stdout.write("❌ API key not found or invalid\n"
+                         "Make sure .env file exists with ANTHROPIC_API_KEY\n")
         return False
 
 if __name__ == '__main__':
-    print("="*50)
-    print("DRL Missile Tracker - Setup Test")
-    print("="*50 + "\n")
+    sys.stdout.write("="*50 + "\nDRL Missile Tracker - Setup Test\n" + "="*50 + "\n\n")
     
-    imports_ok = test_imports()
-    print()
+    # --deep imports every package instead of just locating it
+    imports_ok = test_imports(deep='--deep' in sys.argv)
+    sys.stdout.write("\n")
     api_ok = test_api()
     
-    print("\n" + "="*50)
     if imports_ok and api_ok:
-        print("🎉 Setup complete! You're ready to start.")
+        status = "🎉 Setup complete! You're ready to start."
     else:
-        print("⚠️  Some issues need attention (see above)")
-    print("="*50)
\ No newline at end of file
+        status = "⚠️  Some issues need attention (see above)"
+    sys.stdout.write("\n" + "="*50 + f"\n{status}\n" + "="*50 + "\n")
\ No newline at end of file